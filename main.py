@@ -32,14 +32,16 @@ root_tables = [
 
 allowed_project_ids = ["project-id-1", "project-id-2", "project-id-3"]
 
-result = usecase.execute(
-    ExportLeafTablesRequest(
-        root_tables=root_tables,
-        allowed_project_ids=allowed_project_ids,
-        output_path=Path("output/leaf_tables_from_roots.csv"),
-        output_format="csv",
+# BigQueryクライアントはwithブロック終了時に解放する
+with bq_client_factory:
+    result = usecase.execute(
+        ExportLeafTablesRequest(
+            root_tables=root_tables,
+            allowed_project_ids=allowed_project_ids,
+            output_path=Path("output/leaf_tables_from_roots.csv"),
+            output_format="csv",
+        )
     )
-)
 
 print(f"Root tables: {result.total_tables_count}")
 print(f"Leaf tables: {result.leaf_tables_count}")
@@ -11,7 +11,7 @@ from domain.repositories.table_repository import TableRepository
 from domain.value_objects.table_id import TableId
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportLeafTablesRequest:
     """エクスポートリクエスト.
 
@@ -38,7 +38,7 @@ class ExportLeafTablesRequest:
             raise ValueError("project_ids と root_tables は同時に指定できません")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportLeafTablesResult:
     """エクスポート結果."""
 
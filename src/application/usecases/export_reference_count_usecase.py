@@ -9,7 +9,7 @@ from domain.repositories.file_writer_repository import FileWriterRepository
 from domain.repositories.table_repository import TableRepository
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportReferenceCountRequest:
     """エクスポートリクエスト."""
 
@@ -19,7 +19,7 @@ class ExportReferenceCountRequest:
     output_format: Literal["csv", "json"] = "csv"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportReferenceCountResult:
     """エクスポート結果."""
 
@@ -25,15 +25,15 @@ class LineageNode(Entity[TableId]):
     @property
     def is_leaf(self) -> bool:
         """下流テーブルがない場合にリーフノードと判定."""
-        return len(self.downstream_tables) == 0
+        return not self.downstream_tables
 
     def has_upstream(self) -> bool:
         """上流テーブルが存在するか."""
-        return len(self.upstream_tables) > 0
+        return bool(self.upstream_tables)
 
     def has_downstream(self) -> bool:
         """下流テーブルが存在するか."""
-        return len(self.downstream_tables) > 0
+        return bool(self.downstream_tables)
 
 
 class LeafTable(Entity[TableId]):
@@ -1,7 +1,11 @@
 """BigQueryクライアント管理."""
 
+import threading
+
 from collections.abc import Generator
 from contextlib import contextmanager
+from types import TracebackType
+from typing import Self
 
 from google.api_core.exceptions import GoogleAPIError
 from google.cloud import bigquery
@@ -11,7 +15,11 @@ from infra.bigquery.exceptions import BigQueryConnectionError
 
 
 class BigQueryClientFactory:
-    """BigQueryクライアントのファクトリクラス."""
+    """BigQueryクライアントのファクトリクラス.
+
+    生成したクライアントはファクトリ内で使い回すため、
+    ファクトリ自体をコンテキストマネージャとして使用し、終了時に解放する。
+    """
 
     def __init__(self, project_id: str | None = None) -> None:
         """初期化.
@@ -20,12 +28,18 @@ class BigQueryClientFactory:
             project_id: デフォルトのプロジェクトID（Noneの場合はADCから推論）
         """
         self._project_id = project_id
+        self._client: Client | None = None
+        self._lock = threading.Lock()
 
     @contextmanager
     def get_client(self) -> Generator[Client, None, None]:
         """BigQueryクライアントをコンテキストマネージャとして取得する.
 
         ADC (Application Default Credentials) を使用して認証する。
+        認証情報の解決やHTTPセッションの確立を繰り返さないよう、
+        初回に生成したクライアントを以降の呼び出しで使い回す。
+        このwithブロックを抜けてもクライアントは開いたままとなるため、
+        ファクトリの with 文の終了時または close() の呼び出しで解放する。
 
         Yields:
             BigQuery Client インスタンス
@@ -33,15 +47,48 @@ class BigQueryClientFactory:
         Raises:
             BigQueryConnectionError: クライアント作成に失敗した場合
         """
-        client: Client | None = None
         try:
-            client = bigquery.Client(project=self._project_id)
-            yield client
+            yield self._get_or_create_client()
         except GoogleAPIError as e:
             raise BigQueryConnectionError(
                 f"Failed to create BigQuery client: {e}",
                 cause=e,
             ) from e
-        finally:
-            if client is not None:
-                client.close()
+
+    def __enter__(self) -> Self:
+        """コンテキストに入る.
+
+        Returns:
+            ファクトリ自身
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """コンテキストを抜ける際にキャッシュしているクライアントを閉じる."""
+        self.close()
+
+    def close(self) -> None:
+        """キャッシュしているBigQueryクライアントを閉じる.
+
+        次回の get_client() 呼び出し時にクライアントを再生成する。
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _get_or_create_client(self) -> Client:
+        """キャッシュ済みのクライアントを返し、未生成であれば生成する.
+
+        Returns:
+            BigQuery Client インスタンス
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = bigquery.Client(project=self._project_id)
+            return self._client
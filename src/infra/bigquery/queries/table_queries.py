@@ -66,28 +66,41 @@ def build_list_tables_query(project_ids: Sequence[str]) -> str:
     return with_clause + select_clause
 
 
+# 参照回数クエリは値をクエリパラメータで渡すため、SQL文字列は常に同一となる。
+# プロジェクトIDをSQLへ直接埋め込まず、モジュールロード時に一度だけ組み立てる
+_REFERENCE_COUNT_QUERY = dedent("""
+    SELECT
+        project_id,
+        dataset_id,
+        table_id,
+        SUM(job_count) AS job_count,
+        SUM(unique_user) AS unique_user
+    FROM `abematv-data.test_kono.table_access_count`
+    WHERE
+        dt >= DATE_SUB(CURRENT_DATE('Asia/Tokyo'), INTERVAL @days_back DAY)
+        AND (ARRAY_LENGTH(@project_ids) = 0 OR project_id IN UNNEST(@project_ids))
+    GROUP BY
+        1, 2, 3
+    """)
+
+
 def build_reference_count_query(
     days_back: int = 180,
-) -> str:
+    project_ids: Sequence[str] | None = None,
+) -> tuple[str, dict[str, int | list[str]]]:
     """INFORMATION_SCHEMA.JOBS_BY_PROJECTからテーブル参照回数を取得するクエリを生成する.
 
     Args:
         days_back: 過去何日分を対象とするか
+        project_ids: 集計対象とするプロジェクトIDのリスト。
+            指定した場合、これらのプロジェクトのテーブルのみをBigQuery側で絞り込む。
+            Noneの場合は全プロジェクトを対象とする。
 
     Returns:
-        SQL クエリ文字列
+        (SQL クエリ文字列, クエリパラメータ) のタプル
     """
-
-    return dedent(f"""
-        SELECT
-            project_id,
-            dataset_id,
-            table_id,
-            SUM(job_count) AS job_count,
-            SUM(unique_user) AS unique_user
-        FROM `abematv-data.test_kono.table_access_count`
-        WHERE
-            dt >= DATE_SUB(CURRENT_DATE('Asia/Tokyo'), INTERVAL {days_back} DAY)
-        GROUP BY
-            1, 2, 3
-        """)
+    params: dict[str, int | list[str]] = {
+        "days_back": days_back,
+        "project_ids": list(project_ids or []),
+    }
+    return _REFERENCE_COUNT_QUERY, params
@@ -1,10 +1,18 @@
 """BigQueryを使用したTableRepositoryの実装."""
 
-from collections.abc import Sequence
-from typing import Any
+import sys
+
+from collections.abc import Iterator, Sequence
+from typing import cast
 
 from google.api_core.exceptions import GoogleAPIError
-from google.cloud.bigquery import Client
+from google.cloud.bigquery import (
+    ArrayQueryParameter,
+    Client,
+    QueryJobConfig,
+    ScalarQueryParameter,
+)
+from google.cloud.bigquery.table import Row
 
 from domain.entities.analyzed_table import AnalyzedTable
 from domain.entities.table import Table
@@ -18,6 +26,10 @@ from infra.bigquery.queries.table_queries import (
 )
 
 
+# 参照のないテーブルに共通で設定する利用状況（UsageInfoは不変のため共有できる）
+_NO_USAGE = UsageInfo(job_count=0, unique_user=0)
+
+
 class BigQueryTableRepository:
     """BigQueryを使用したTableRepositoryの実装."""
 
@@ -50,19 +62,18 @@ class BigQueryTableRepository:
             with self._client_factory.get_client() as client:
                 results = self._execute_query(client, query)
 
-                tables: list[Table] = []
-                for row in results:
-                    table = Table(
+                # 行ごとに重複するproject_id/dataset_idはinternして同一オブジェクトを共有する
+                return [
+                    Table(
                         table_id=TableId(
-                            project_id=row["project_id"],
-                            dataset_id=row["dataset_id"],
+                            project_id=sys.intern(row["project_id"]),
+                            dataset_id=sys.intern(row["dataset_id"]),
                             table_id=row["table_id"],
                         ),
                         table_type=row["table_type"],
                     )
-                    tables.append(table)
-
-                return tables
+                    for row in results
+                ]
 
         except BigQueryQueryError as e:
             raise TableRepositoryError(
@@ -90,40 +101,27 @@ class BigQueryTableRepository:
         if not tables:
             return []
 
-        query = build_reference_count_query(days_back)
+        # 対象テーブルのプロジェクトに絞って集計し、不要な行を転送しない
+        project_ids = list(dict.fromkeys(t.table_id.project_id for t in tables))
+        query, params = build_reference_count_query(days_back, project_ids)
+
+        # 結果行の読み込みと結合を1パスで行い、対象外テーブルの行は保持しない
+        target_keys = {self._to_key(table) for table in tables}
 
         try:
             with self._client_factory.get_client() as client:
-                results = self._execute_query(client, query)
+                results = self._execute_query(client, query, params)
 
                 reference_map: dict[tuple[str, str, str], tuple[int, int]] = {}
                 for row in results:
-                    key = (
-                        row["project_id"],
-                        row["dataset_id"],
-                        row["table_id"],
-                    )
-                    reference_map[key] = (row["job_count"], row["unique_user"])
-
-                analyzed_tables: list[AnalyzedTable] = []
-                for table in tables:
-                    key = (
-                        table.table_id.project_id,
-                        table.table_id.dataset_id,
-                        table.table_id.table_id,
+                    key = cast(
+                        "tuple[str, str, str]",
+                        (row["project_id"], row["dataset_id"], row["table_id"]),
                     )
-                    job_count, unique_user = reference_map.get(key, (0, 0))
+                    if key in target_keys:
+                        reference_map[key] = (row["job_count"], row["unique_user"])
 
-                    analyzed_table = AnalyzedTable(
-                        table=table,
-                        usage_info=UsageInfo(
-                            job_count=job_count,
-                            unique_user=unique_user,
-                        ),
-                    )
-                    analyzed_tables.append(analyzed_table)
-
-                return analyzed_tables
+            return [self._to_analyzed_table(table, reference_map) for table in tables]
 
         except BigQueryQueryError as e:
             raise TableRepositoryError(
@@ -131,26 +129,100 @@ class BigQueryTableRepository:
                 cause=e,
             ) from e
 
-    def _execute_query(self, client: Client, query: str) -> list[dict[str, Any]]:
-        """クエリを実行し結果を辞書のリストとして返す.
+    def _to_analyzed_table(
+        self,
+        table: Table,
+        reference_map: dict[tuple[str, str, str], tuple[int, int]],
+    ) -> AnalyzedTable:
+        """参照回数マップからAnalyzedTableを生成する.
+
+        Args:
+            table: 対象テーブル
+            reference_map: (project_id, dataset_id, table_id) をキーとする参照回数マップ
+
+        Returns:
+            usage_info設定済みのAnalyzedTable（参照がない場合は0件として扱う）
+        """
+        counts = reference_map.get(self._to_key(table))
+        if counts is None:
+            return AnalyzedTable(table=table, usage_info=_NO_USAGE)
+
+        job_count, unique_user = counts
+        return AnalyzedTable(
+            table=table,
+            usage_info=UsageInfo(job_count=job_count, unique_user=unique_user),
+        )
+
+    @staticmethod
+    def _to_key(table: Table) -> tuple[str, str, str]:
+        """参照回数マップのキーを生成する.
+
+        Args:
+            table: 対象テーブル
+
+        Returns:
+            (project_id, dataset_id, table_id) のタプル
+        """
+        return (
+            table.table_id.project_id,
+            table.table_id.dataset_id,
+            table.table_id.table_id,
+        )
+
+    def _execute_query(
+        self,
+        client: Client,
+        query: str,
+        params: dict[str, int | list[str]] | None = None,
+    ) -> Iterator[Row]:
+        """クエリを実行し結果を1行ずつ返す.
+
+        結果全体をリストに展開せず、ページ単位で取得しながら逐次返す。
+        Rowはカラム名でのアクセスに対応しているため、辞書へ変換せずそのまま返す。
+        クエリはイテレーション開始時に実行されるため、呼び出し側は
+        クライアントのコンテキスト内で消費すること。
 
         Args:
             client: BigQueryクライアント
             query: 実行するSQLクエリ
+            params: クエリパラメータ（名前と値の辞書）
 
-        Returns:
-            結果の辞書リスト
+        Yields:
+            結果行
 
         Raises:
             BigQueryQueryError: クエリ実行に失敗した場合
         """
         try:
-            query_job = client.query(query)
-            results = query_job.result()
-            return [dict(row.items()) for row in results]  # pyright: ignore[reportUnknownVariableType]
+            job_config = QueryJobConfig(
+                query_parameters=[
+                    self._to_query_parameter(name, value)
+                    for name, value in (params or {}).items()
+                ]
+            )
+            query_job = client.query(query, job_config=job_config)
+            yield from query_job.result()
         except GoogleAPIError as e:
             raise BigQueryQueryError(
                 f"Query execution failed: {e}",
                 query=query,
+                params=params,
                 cause=e,
             ) from e
+
+    @staticmethod
+    def _to_query_parameter(
+        name: str, value: int | list[str]
+    ) -> ScalarQueryParameter | ArrayQueryParameter:
+        """値の型に応じたクエリパラメータを生成する.
+
+        Args:
+            name: パラメータ名
+            value: パラメータ値（整数または文字列のリスト）
+
+        Returns:
+            BigQueryのクエリパラメータ
+        """
+        if isinstance(value, list):
+            return ArrayQueryParameter(name, "STRING", value)
+        return ScalarQueryParameter(name, "INT64", value)
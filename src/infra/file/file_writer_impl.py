@@ -33,20 +33,25 @@ class PandasFileWriter:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # 行ごとのdictを経由せず、列ごとのリストから一度に構築する
+            table_ids = [t.table.table_id for t in tables]
+            usage_infos = [t.usage_info for t in tables]
             df = pd.DataFrame(
-                [
-                    {
-                        "project_id": t.table.table_id.project_id,
-                        "dataset_id": t.table.table_id.dataset_id,
-                        "table_id": t.table.table_id.table_id,
-                        "table_type": t.table.table_type,
-                        "job_count": t.usage_info.job_count if t.usage_info else None,
-                        "unique_user": t.usage_info.unique_user
-                        if t.usage_info
-                        else None,
-                    }
-                    for t in tables
-                ]
+                {
+                    "project_id": [tid.project_id for tid in table_ids],
+                    "dataset_id": [tid.dataset_id for tid in table_ids],
+                    "table_id": [tid.table_id for tid in table_ids],
+                    "table_type": [t.table.table_type for t in tables],
+                    # 利用状況が未取得の行があってもfloatにならないよう nullable 整数型にする
+                    "job_count": pd.array(
+                        [u.job_count if u else None for u in usage_infos],
+                        dtype="Int64",
+                    ),
+                    "unique_user": pd.array(
+                        [u.unique_user if u else None for u in usage_infos],
+                        dtype="Int64",
+                    ),
+                }
             )
 
             self._write_dataframe(df, output_path, output_format)
@@ -76,17 +81,16 @@ class PandasFileWriter:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # 行ごとのdictを経由せず、列ごとのリストから一度に構築する
+            table_ids = [t.table_id for t in tables]
             df = pd.DataFrame(
-                [
-                    {
-                        "project_id": t.table_id.project_id,
-                        "dataset_id": t.table_id.dataset_id,
-                        "table_id": t.table_id.table_id,
-                        "fqn": f"{t.table_id.project_id}.{t.table_id.dataset_id}.{t.table_id.table_id}",
-                        "upstream_count": t.upstream_count,
-                    }
-                    for t in tables
-                ]
+                {
+                    "project_id": [tid.project_id for tid in table_ids],
+                    "dataset_id": [tid.dataset_id for tid in table_ids],
+                    "table_id": [tid.table_id for tid in table_ids],
+                    "fqn": [tid.fqn for tid in table_ids],
+                    "upstream_count": [t.upstream_count for t in tables],
+                }
             )
 
             self._write_dataframe(df, output_path, output_format)
@@ -1,7 +1,9 @@
 """Lineage APIを使用したLineageRepositoryの実装."""
 
-from collections import deque
+import sys
+
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 from google.api_core.exceptions import GoogleAPIError
 from google.cloud.datacatalog_lineage_v1 import (
@@ -16,6 +18,14 @@ from infra.lineage.client import LineageClientFactory
 from infra.lineage.exceptions import LineageApiError, LineageRepositoryError
 
 
+# Lineage APIのクォータを考慮した同時検索数の上限
+_MAX_CONCURRENT_SEARCHES = 8
+
+# search_linksの1ページあたりの取得件数（APIの上限値）。
+# 既定値(10件)のままでは下流の多いテーブルで往復回数が増えるため上限まで引き上げる
+_SEARCH_LINKS_PAGE_SIZE = 100
+
+
 class DataCatalogLineageRepository:
     """Lineage APIを使用したLineageRepositoryの実装."""
 
@@ -40,21 +50,24 @@ class DataCatalogLineageRepository:
             LineageRepositoryError: リネージ情報取得に失敗した場合
         """
         try:
-            with self._client_factory.get_client() as client:
+            with (
+                self._client_factory.get_client() as client,
+                ThreadPoolExecutor(max_workers=2) as executor,
+            ):
                 fqn = self._build_bigquery_fqn(table_id)
 
-                upstream_tables = self._search_upstream_tables(
-                    client, table_id.project_id, fqn
+                # 上流・下流の検索は互いに独立したAPI呼び出しのため並行して実行する
+                upstream_future = executor.submit(
+                    self._search_upstream_tables, client, table_id.project_id, fqn
                 )
-
-                downstream_tables = self._search_downstream_tables(
-                    client, table_id.project_id, fqn
+                downstream_future = executor.submit(
+                    self._search_downstream_tables, client, table_id.project_id, fqn
                 )
 
                 return LineageNode(
                     table_id=table_id,
-                    upstream_tables=upstream_tables,
-                    downstream_tables=downstream_tables,
+                    upstream_tables=upstream_future.result(),
+                    downstream_tables=downstream_future.result(),
                 )
 
         except LineageApiError as e:
@@ -86,38 +99,20 @@ class DataCatalogLineageRepository:
             return []
 
         allowed_projects = set(allowed_project_ids) if allowed_project_ids else None
-        leaf_tables: list[LeafTable] = []
 
         try:
-            with self._client_factory.get_client() as client:
-                for table_id in table_ids:
-                    fqn = self._build_bigquery_fqn(table_id)
-
-                    downstream_tables = self._search_downstream_tables(
-                        client, table_id.project_id, fqn
-                    )
-
-                    # 許可されたプロジェクト内の下流テーブルのみをフィルタリング
-                    if allowed_projects is not None:
-                        downstream_tables = [
-                            dt
-                            for dt in downstream_tables
-                            if dt.project_id in allowed_projects
-                        ]
-
-                    if len(downstream_tables) == 0:
-                        upstream_tables = self._search_upstream_tables(
-                            client, table_id.project_id, fqn
-                        )
-
-                        leaf_tables.append(
-                            LeafTable(
-                                table_id=table_id,
-                                upstream_count=len(upstream_tables),
-                            )
-                        )
-
-            return leaf_tables
+            with (
+                self._client_factory.get_client() as client,
+                ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_SEARCHES) as executor,
+            ):
+                # テーブルごとの判定は互いに独立したAPI呼び出しのため並行して実行する
+                results = executor.map(
+                    lambda table_id: self._to_leaf_table(
+                        client, table_id, allowed_projects
+                    ),
+                    table_ids,
+                )
+                return [leaf for leaf in results if leaf is not None]
 
         except LineageApiError as e:
             raise LineageRepositoryError(
@@ -134,6 +129,7 @@ class DataCatalogLineageRepository:
 
         BFS（幅優先探索）でルートテーブルから下流を辿り、
         下流を持たないテーブル（リーフノード）を収集する。
+        同じ階層のテーブルのリネージ検索は並行して実行する。
 
         Args:
             root_tables: 探索の起点となるテーブルIDのリスト
@@ -154,42 +150,46 @@ class DataCatalogLineageRepository:
         allowed_projects = set(allowed_project_ids) if allowed_project_ids else None
         leaf_tables: list[LeafTable] = []
         visited: set[str] = set()
-        queue: deque[TableId] = deque(root_tables)
+        frontier = self._unvisited(root_tables, visited)
 
         try:
-            with self._client_factory.get_client() as client:
-                while queue:
-                    current = queue.popleft()
-                    fqn = self._build_bigquery_fqn(current)
-
-                    if fqn in visited:
-                        continue
-                    visited.add(fqn)
+            with (
+                self._client_factory.get_client() as client,
+                ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_SEARCHES) as executor,
+            ):
+                # 同じ階層のテーブルの検索は互いに独立しているため、階層単位で並行して実行する
+                while frontier:
+                    downstream_results = executor.map(
+                        lambda table_id: self._search_allowed_downstream_tables(
+                            client, table_id, allowed_projects
+                        ),
+                        frontier,
+                    )
 
-                    downstream = self._search_downstream_tables(
-                        client, current.project_id, fqn
+                    leaves: list[TableId] = []
+                    next_tables: list[TableId] = []
+                    for current, downstream in zip(
+                        frontier, downstream_results, strict=True
+                    ):
+                        if downstream:
+                            next_tables.extend(downstream)
+                        else:
+                            leaves.append(current)
+
+                    upstream_results = executor.map(
+                        lambda table_id: self._search_upstream_tables(
+                            client,
+                            table_id.project_id,
+                            self._build_bigquery_fqn(table_id),
+                        ),
+                        leaves,
+                    )
+                    leaf_tables.extend(
+                        LeafTable(table_id=leaf, upstream_count=len(upstream))
+                        for leaf, upstream in zip(leaves, upstream_results, strict=True)
                     )
 
-                    # 許可されたプロジェクト内の下流テーブルのみをフィルタリング
-                    if allowed_projects is not None:
-                        downstream = [
-                            dt for dt in downstream if dt.project_id in allowed_projects
-                        ]
-
-                    if not downstream:
-                        upstream = self._search_upstream_tables(
-                            client, current.project_id, fqn
-                        )
-                        leaf_tables.append(
-                            LeafTable(
-                                table_id=current,
-                                upstream_count=len(upstream),
-                            )
-                        )
-                    else:
-                        for dt in downstream:
-                            if self._build_bigquery_fqn(dt) not in visited:
-                                queue.append(dt)
+                    frontier = self._unvisited(next_tables, visited)
 
             return leaf_tables
 
@@ -199,6 +199,80 @@ class DataCatalogLineageRepository:
                 cause=e,
             ) from e
 
+    def _to_leaf_table(
+        self,
+        client: LineageClient,
+        table_id: TableId,
+        allowed_projects: set[str] | None,
+    ) -> LeafTable | None:
+        """テーブルがリーフノードであればLeafTableに変換する.
+
+        Args:
+            client: Lineage APIクライアント
+            table_id: 判定対象のテーブルID
+            allowed_projects: 下流として扱うプロジェクトIDの集合（Noneの場合は全て）
+
+        Returns:
+            リーフノードの場合はLeafTable、そうでなければNone
+
+        Raises:
+            LineageApiError: API呼び出しに失敗した場合
+        """
+        if self._search_allowed_downstream_tables(client, table_id, allowed_projects):
+            return None
+
+        fqn = self._build_bigquery_fqn(table_id)
+        upstream_tables = self._search_upstream_tables(client, table_id.project_id, fqn)
+        return LeafTable(table_id=table_id, upstream_count=len(upstream_tables))
+
+    def _search_allowed_downstream_tables(
+        self,
+        client: LineageClient,
+        table_id: TableId,
+        allowed_projects: set[str] | None,
+    ) -> list[TableId]:
+        """許可されたプロジェクト内の下流テーブルを検索する.
+
+        Args:
+            client: Lineage APIクライアント
+            table_id: 対象テーブルのID
+            allowed_projects: 下流として扱うプロジェクトIDの集合（Noneの場合は全て）
+
+        Returns:
+            下流テーブルIDのリスト
+
+        Raises:
+            LineageApiError: API呼び出しに失敗した場合
+        """
+        downstream_tables = self._search_downstream_tables(
+            client, table_id.project_id, self._build_bigquery_fqn(table_id)
+        )
+
+        # 許可されたプロジェクト内の下流テーブルのみをフィルタリング
+        if allowed_projects is None:
+            return downstream_tables
+        return [dt for dt in downstream_tables if dt.project_id in allowed_projects]
+
+    def _unvisited(
+        self, table_ids: Sequence[TableId], visited: set[str]
+    ) -> list[TableId]:
+        """未訪問のテーブルを順序を保って重複なく取り出し、訪問済みにする.
+
+        Args:
+            table_ids: 候補のテーブルIDのリスト
+            visited: 訪問済みテーブルのFQNの集合（取り出したテーブルが追加される）
+
+        Returns:
+            未訪問だったテーブルIDのリスト
+        """
+        unvisited: list[TableId] = []
+        for table_id in table_ids:
+            fqn = self._build_bigquery_fqn(table_id)
+            if fqn not in visited:
+                visited.add(fqn)
+                unvisited.append(table_id)
+        return unvisited
+
     def _build_bigquery_fqn(self, table_id: TableId) -> str:
         """BigQueryテーブルのFully Qualified Nameを構築する.
 
@@ -208,9 +282,7 @@ class DataCatalogLineageRepository:
         Returns:
             Lineage API用のFQN (例: "bigquery:project.dataset.table")
         """
-        return (
-            f"bigquery:{table_id.project_id}.{table_id.dataset_id}.{table_id.table_id}"
-        )
+        return f"bigquery:{table_id.fqn}"
 
     def _search_upstream_tables(
         self,
@@ -240,6 +312,7 @@ class DataCatalogLineageRepository:
             request = SearchLinksRequest(
                 parent=parent,
                 target=target_ref,
+                page_size=_SEARCH_LINKS_PAGE_SIZE,
             )
 
             upstream_tables: list[TableId] = []
@@ -287,6 +360,7 @@ class DataCatalogLineageRepository:
             request = SearchLinksRequest(
                 parent=parent,
                 source=source_ref,
+                page_size=_SEARCH_LINKS_PAGE_SIZE,
             )
 
             downstream_tables: list[TableId] = []
@@ -332,8 +406,9 @@ class DataCatalogLineageRepository:
         if len(parts) != 3:
             return None
 
+        # 同じプロジェクト・データセットが大量に現れるためinternして共有する
         return TableId(
-            project_id=parts[0],
-            dataset_id=parts[1],
+            project_id=sys.intern(parts[0]),
+            dataset_id=sys.intern(parts[1]),
             table_id=parts[2],
         )
@@ -0,0 +1,24 @@
+"""ユースケーステスト共通のフィクスチャ."""
+
+from pathlib import Path
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from domain.repositories.file_writer_repository import FileWriterRepository
+
+
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """出力先ディレクトリのフィクスチャ.
+
+    ユースケーステストではFileWriterをモックしており実際には書き込まないため、
+    テストごとにディレクトリを作成せずモジュール単位で共有する。
+    """
+    return tmp_path_factory.mktemp("out")
+
+
+@pytest.fixture
+def mock_file_writer() -> Mock:
+    """モックFileWriterのフィクスチャ."""
+    return create_autospec(FileWriterRepository, instance=True, spec_set=True)
@@ -1,7 +1,8 @@
 """ExportLeafTablesUseCaseのユニットテスト."""
 
 from pathlib import Path
-from unittest.mock import Mock
+from typing import Any, Literal
+from unittest.mock import Mock, create_autospec
 
 import pytest
 
@@ -11,16 +12,82 @@ from application.usecases.export_leaf_tables_usecase import (
 )
 from domain.entities.lineage import LeafTable
 from domain.entities.table import Table
+from domain.repositories.lineage_repository import LineageRepository
+from domain.repositories.table_repository import TableRepository
 from domain.value_objects.table_id import TableId
 
 
+# 呼び出し引数との比較に使い回す読み取り専用の定数
+_PROJECTS_A = ["project-a"]
+
+# 探索起点となるルートテーブルと、そこから辿ったリーフテーブル
+_ROOT_TABLES = [
+    TableId(project_id="project-a", dataset_id="raw", table_id="events"),
+    TableId(project_id="project-a", dataset_id="raw", table_id="users"),
+]
+_LEAF_TABLES = [
+    LeafTable(
+        table_id=TableId(
+            project_id="project-a",
+            dataset_id="reports",
+            table_id="final_report",
+        ),
+        upstream_count=3,
+    ),
+]
+
+
+@pytest.fixture
+def mock_table_repository() -> Mock:
+    """モックTableRepositoryのフィクスチャ."""
+    attrs: dict[str, Any] = {
+        "list_tables.return_value": [
+            Table(
+                table_id=TableId(
+                    project_id="project-a",
+                    dataset_id="dataset1",
+                    table_id="table1",
+                ),
+                table_type="BASE TABLE",
+            ),
+            Table(
+                table_id=TableId(
+                    project_id="project-a",
+                    dataset_id="dataset1",
+                    table_id="table2",
+                ),
+                table_type="BASE TABLE",
+            ),
+        ],
+    }
+    return create_autospec(TableRepository, instance=True, spec_set=True, **attrs)
+
+
+@pytest.fixture
+def mock_lineage_repository() -> Mock:
+    """モックLineageRepositoryのフィクスチャ."""
+    attrs: dict[str, Any] = {
+        "get_leaf_tables.return_value": [
+            LeafTable(
+                table_id=TableId(
+                    project_id="project-a",
+                    dataset_id="dataset1",
+                    table_id="table2",
+                ),
+                upstream_count=1,
+            ),
+        ],
+    }
+    return create_autospec(LineageRepository, instance=True, spec_set=True, **attrs)
+
+
 class TestExportLeafTablesRequest:
     """ExportLeafTablesRequestのテストクラス."""
 
     def test_valid_with_project_ids(self) -> None:
         """project_idsのみ指定で正常に作成できることを確認."""
-        request = ExportLeafTablesRequest(project_ids=["project-a"])
-        assert request.project_ids == ["project-a"]
+        request = ExportLeafTablesRequest(project_ids=_PROJECTS_A)
+        assert request.project_ids == _PROJECTS_A
         assert request.root_tables is None
 
     def test_valid_with_root_tables(self) -> None:
@@ -41,7 +108,7 @@ class TestExportLeafTablesRequest:
         """両方指定した場合にエラーになることを確認."""
         with pytest.raises(ValueError, match="同時に指定できません"):
             ExportLeafTablesRequest(
-                project_ids=["project-a"],
+                project_ids=_PROJECTS_A,
                 root_tables=[
                     TableId(project_id="project-a", dataset_id="raw", table_id="events")
                 ],
@@ -52,79 +119,35 @@ class TestExportLeafTablesUseCase:
     """ExportLeafTablesUseCaseのテストクラス."""
 
     @pytest.fixture
-    def mock_table_repository(self) -> Mock:
-        """モックTableRepositoryのフィクスチャ."""
-        mock = Mock()
-        mock.list_tables.return_value = [
-            Table(
-                table_id=TableId(
-                    project_id="project-a",
-                    dataset_id="dataset1",
-                    table_id="table1",
-                ),
-                table_type="BASE TABLE",
-            ),
-            Table(
-                table_id=TableId(
-                    project_id="project-a",
-                    dataset_id="dataset1",
-                    table_id="table2",
-                ),
-                table_type="BASE TABLE",
-            ),
-        ]
-        return mock
-
-    @pytest.fixture
-    def mock_lineage_repository(self) -> Mock:
-        """モックLineageRepositoryのフィクスチャ."""
-        mock = Mock()
-        mock.get_leaf_tables.return_value = [
-            LeafTable(
-                table_id=TableId(
-                    project_id="project-a",
-                    dataset_id="dataset1",
-                    table_id="table2",
-                ),
-                upstream_count=1,
-            ),
-        ]
-        mock.find_leaf_tables_from_roots.return_value = [
-            LeafTable(
-                table_id=TableId(
-                    project_id="project-a",
-                    dataset_id="reports",
-                    table_id="final_report",
-                ),
-                upstream_count=3,
-            ),
-        ]
-        return mock
-
-    @pytest.fixture
-    def mock_file_writer(self) -> Mock:
-        """モックFileWriterのフィクスチャ."""
-        return Mock()
-
-    def test_execute_with_project_ids(
+    def usecase(
         self,
         mock_table_repository: Mock,
         mock_lineage_repository: Mock,
         mock_file_writer: Mock,
-        tmp_path: Path,
-    ) -> None:
-        """project_ids指定で正常にエクスポートできることを確認."""
-        usecase = ExportLeafTablesUseCase(
+    ) -> ExportLeafTablesUseCase:
+        """モックを注入したExportLeafTablesUseCaseのフィクスチャ."""
+        return ExportLeafTablesUseCase(
             table_repository=mock_table_repository,
             lineage_repository=mock_lineage_repository,
             file_writer=mock_file_writer,
         )
 
-        output_path = tmp_path / "leaf_tables.csv"
+    @pytest.mark.parametrize("output_format", ["csv", "json"])
+    def test_execute_with_project_ids(
+        self,
+        usecase: ExportLeafTablesUseCase,
+        mock_table_repository: Mock,
+        mock_lineage_repository: Mock,
+        mock_file_writer: Mock,
+        out_dir: Path,
+        output_format: Literal["csv", "json"],
+    ) -> None:
+        """project_ids指定で各出力形式にエクスポートできることを確認."""
+        output_path = out_dir / f"leaf_tables.{output_format}"
         request = ExportLeafTablesRequest(
-            project_ids=["project-a"],
+            project_ids=_PROJECTS_A,
             output_path=output_path,
-            output_format="csv",
+            output_format=output_format,
         )
 
         result = usecase.execute(request)
@@ -133,29 +156,36 @@ class TestExportLeafTablesUseCase:
         assert result.leaf_tables_count == 1
         assert result.output_path == output_path
 
-        mock_table_repository.list_tables.assert_called_once_with(["project-a"])
+        mock_table_repository.list_tables.assert_called_once_with(_PROJECTS_A)
         mock_lineage_repository.get_leaf_tables.assert_called_once()
-        mock_file_writer.write_leaf_tables.assert_called_once()
+        mock_file_writer.write_leaf_tables.assert_called_once_with(
+            mock_lineage_repository.get_leaf_tables.return_value,
+            output_path,
+            output_format,
+        )
 
+    @pytest.mark.parametrize(
+        ("root_tables", "leaf_tables", "expected_total", "expected_leaf"),
+        [(_ROOT_TABLES, _LEAF_TABLES, 2, 1), ([], [], 0, 0)],
+        ids=["roots", "empty"],
+    )
     def test_execute_with_root_tables(
         self,
+        usecase: ExportLeafTablesUseCase,
         mock_table_repository: Mock,
         mock_lineage_repository: Mock,
         mock_file_writer: Mock,
-        tmp_path: Path,
+        out_dir: Path,
+        root_tables: list[TableId],
+        leaf_tables: list[LeafTable],
+        expected_total: int,
+        expected_leaf: int,
     ) -> None:
-        """root_tables指定で正常にエクスポートできることを確認."""
-        usecase = ExportLeafTablesUseCase(
-            table_repository=mock_table_repository,
-            lineage_repository=mock_lineage_repository,
-            file_writer=mock_file_writer,
-        )
+        """root_tables指定（空リストを含む）で正常にエクスポートできることを確認."""
+        find_leaf_tables = mock_lineage_repository.find_leaf_tables_from_roots
+        find_leaf_tables.return_value = leaf_tables
 
-        root_tables = [
-            TableId(project_id="project-a", dataset_id="raw", table_id="events"),
-            TableId(project_id="project-a", dataset_id="raw", table_id="users"),
-        ]
-        output_path = tmp_path / "leaf_tables.csv"
+        output_path = out_dir / "leaf_tables.csv"
         request = ExportLeafTablesRequest(
             root_tables=root_tables,
             output_path=output_path,
@@ -164,8 +194,8 @@ class TestExportLeafTablesUseCase:
 
         result = usecase.execute(request)
 
-        assert result.total_tables_count == 2  # ルートテーブル数
-        assert result.leaf_tables_count == 1
+        assert result.total_tables_count == expected_total  # ルートテーブル数
+        assert result.leaf_tables_count == expected_leaf
         assert result.output_path == output_path
 
         # project_idsモードのメソッドは呼ばれない
@@ -173,60 +203,10 @@ class TestExportLeafTablesUseCase:
         mock_lineage_repository.get_leaf_tables.assert_not_called()
 
         # root_tablesモードのメソッドが呼ばれる
-        mock_lineage_repository.find_leaf_tables_from_roots.assert_called_once_with(
+        find_leaf_tables.assert_called_once_with(
             root_tables,
             allowed_project_ids=None,
         )
-        mock_file_writer.write_leaf_tables.assert_called_once()
-
-    def test_execute_with_json_format(
-        self,
-        mock_table_repository: Mock,
-        mock_lineage_repository: Mock,
-        mock_file_writer: Mock,
-        tmp_path: Path,
-    ) -> None:
-        """JSON形式でエクスポートできることを確認."""
-        usecase = ExportLeafTablesUseCase(
-            table_repository=mock_table_repository,
-            lineage_repository=mock_lineage_repository,
-            file_writer=mock_file_writer,
-        )
-
-        output_path = tmp_path / "leaf_tables.json"
-        request = ExportLeafTablesRequest(
-            project_ids=["project-a"],
-            output_path=output_path,
-            output_format="json",
-        )
-
-        usecase.execute(request)
-
-        call_args = mock_file_writer.write_leaf_tables.call_args
-        assert call_args[0][2] == "json"
-
-    def test_execute_empty_root_tables(
-        self,
-        mock_table_repository: Mock,
-        mock_file_writer: Mock,
-        tmp_path: Path,
-    ) -> None:
-        """空のroot_tablesリストでも正常に動作することを確認."""
-        mock_lineage_repo = Mock()
-        mock_lineage_repo.find_leaf_tables_from_roots.return_value = []
-
-        usecase = ExportLeafTablesUseCase(
-            table_repository=mock_table_repository,
-            lineage_repository=mock_lineage_repo,
-            file_writer=mock_file_writer,
-        )
-
-        request = ExportLeafTablesRequest(
-            root_tables=[],
-            output_path=tmp_path / "leaf_tables.csv",
+        mock_file_writer.write_leaf_tables.assert_called_once_with(
+            leaf_tables, output_path, "csv"
         )
-
-        result = usecase.execute(request)
-
-        assert result.total_tables_count == 0
-        assert result.leaf_tables_count == 0
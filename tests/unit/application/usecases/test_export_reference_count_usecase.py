@@ -1,7 +1,8 @@
 """ExportReferenceCountUseCaseのユニットテスト."""
 
 from pathlib import Path
-from unittest.mock import Mock
+from typing import Any, Literal
+from unittest.mock import Mock, create_autospec
 
 import pytest
 
@@ -11,148 +12,119 @@ from application.usecases.export_reference_count_usecase import (
 )
 from domain.entities.analyzed_table import AnalyzedTable
 from domain.entities.table import Table
+from domain.repositories.table_repository import TableRepository
 from domain.value_objects.table_id import TableId
 from domain.value_objects.usage_info import UsageInfo
 
 
-@pytest.fixture
-def mock_table_repository() -> Mock:
-    """モックTableRepositoryのフィクスチャ."""
-    mock = Mock()
-
-    table = Table(
-        table_id=TableId(
-            project_id="project-a",
-            dataset_id="dataset1",
-            table_id="table1",
-        ),
-        table_type="BASE TABLE",
-    )
+# 呼び出し引数との比較に使い回す読み取り専用の定数
+_PROJECTS_A = ["project-a"]
+_PROJECTS_AB = ["project-a", "project-b"]
 
-    # list_tablesの戻り値を設定
-    mock.list_tables.return_value = [table]
 
-    # get_table_reference_countsの戻り値を設定
-    mock.get_table_reference_counts.return_value = [
-        AnalyzedTable(
-            table=table,
-            usage_info=UsageInfo(job_count=100, unique_user=5),
-        ),
-    ]
-
-    return mock
+_TABLE = Table(
+    table_id=TableId(
+        project_id="project-a",
+        dataset_id="dataset1",
+        table_id="table1",
+    ),
+    table_type="BASE TABLE",
+)
+_ANALYZED_TABLE = AnalyzedTable(
+    table=_TABLE,
+    usage_info=UsageInfo(job_count=100, unique_user=5),
+)
 
 
 @pytest.fixture
-def mock_file_writer() -> Mock:
-    """モックFileWriterのフィクスチャ."""
-    return Mock()
+def mock_table_repository() -> Mock:
+    """モックTableRepositoryのフィクスチャ."""
+    attrs: dict[str, Any] = {
+        "list_tables.return_value": [_TABLE],
+        "get_table_reference_counts.return_value": [_ANALYZED_TABLE],
+    }
+    return create_autospec(TableRepository, instance=True, spec_set=True, **attrs)
 
 
 class TestExportReferenceCountUseCase:
     """ExportReferenceCountUseCaseのテストクラス."""
 
-    def test_execute_success(
+    @pytest.fixture
+    def usecase(
         self,
         mock_table_repository: Mock,
         mock_file_writer: Mock,
-        tmp_path: Path,
-    ) -> None:
-        """正常にエクスポートできることを確認."""
-        usecase = ExportReferenceCountUseCase(
+    ) -> ExportReferenceCountUseCase:
+        """モックを注入したExportReferenceCountUseCaseのフィクスチャ."""
+        return ExportReferenceCountUseCase(
             table_repository=mock_table_repository,
             file_writer=mock_file_writer,
         )
 
-        output_path = tmp_path / "output.csv"
+    @pytest.mark.parametrize(
+        ("output_format", "days_back", "tables", "analyzed_tables", "expected_count"),
+        [
+            ("csv", 90, [_TABLE], [_ANALYZED_TABLE], 1),
+            ("json", 30, [_TABLE], [_ANALYZED_TABLE], 1),
+            ("csv", 90, [], [], 0),
+        ],
+        ids=["csv", "json", "empty"],
+    )
+    def test_execute_success(
+        self,
+        usecase: ExportReferenceCountUseCase,
+        mock_table_repository: Mock,
+        mock_file_writer: Mock,
+        out_dir: Path,
+        output_format: Literal["csv", "json"],
+        days_back: int,
+        tables: list[Table],
+        analyzed_tables: list[AnalyzedTable],
+        expected_count: int,
+    ) -> None:
+        """各出力形式で正常にエクスポートでき、テーブル0件でも動作することを確認."""
+        mock_table_repository.list_tables.return_value = tables
+        mock_table_repository.get_table_reference_counts.return_value = analyzed_tables
+
+        output_path = out_dir / f"output.{output_format}"
         request = ExportReferenceCountRequest(
-            project_ids=["project-a"],
-            days_back=90,
+            project_ids=_PROJECTS_A,
+            days_back=days_back,
             output_path=output_path,
-            output_format="csv",
+            output_format=output_format,
         )
 
         result = usecase.execute(request)
 
-        assert result.tables_count == 1
+        assert result.tables_count == expected_count
         assert result.output_path == output_path
 
         # リポジトリが正しく呼び出されたことを確認
-        mock_table_repository.list_tables.assert_called_once_with(["project-a"])
-        mock_table_repository.get_table_reference_counts.assert_called_once()
-
-        # ファイル出力が呼び出されたことを確認
-        mock_file_writer.write_analyzed_tables.assert_called_once()
-
-    def test_execute_with_json_format(
-        self,
-        mock_table_repository: Mock,
-        mock_file_writer: Mock,
-        tmp_path: Path,
-    ) -> None:
-        """JSON形式でエクスポートできることを確認."""
-        usecase = ExportReferenceCountUseCase(
-            table_repository=mock_table_repository,
-            file_writer=mock_file_writer,
+        mock_table_repository.list_tables.assert_called_once_with(_PROJECTS_A)
+        mock_table_repository.get_table_reference_counts.assert_called_once_with(
+            tables,
+            days_back=days_back,
         )
 
-        output_path = tmp_path / "output.json"
-        request = ExportReferenceCountRequest(
-            project_ids=["project-a"],
-            days_back=30,
-            output_path=output_path,
-            output_format="json",
+        # ファイル出力が指定形式で呼び出されたことを確認
+        mock_file_writer.write_analyzed_tables.assert_called_once_with(
+            analyzed_tables,
+            output_path,
+            output_format,
         )
 
-        usecase.execute(request)
-
-        # ファイル出力がJSON形式で呼び出されたことを確認
-        call_args = mock_file_writer.write_analyzed_tables.call_args
-        assert call_args[0][2] == "json"  # output_format
-
     def test_execute_with_multiple_projects(
         self,
+        usecase: ExportReferenceCountUseCase,
         mock_table_repository: Mock,
-        mock_file_writer: Mock,
-        tmp_path: Path,
+        out_dir: Path,
     ) -> None:
         """複数プロジェクトでエクスポートできることを確認."""
-        usecase = ExportReferenceCountUseCase(
-            table_repository=mock_table_repository,
-            file_writer=mock_file_writer,
-        )
-
         request = ExportReferenceCountRequest(
-            project_ids=["project-a", "project-b"],
-            output_path=tmp_path / "output.csv",
+            project_ids=_PROJECTS_AB,
+            output_path=out_dir / "output.csv",
         )
 
         usecase.execute(request)
 
-        mock_table_repository.list_tables.assert_called_once_with(
-            ["project-a", "project-b"]
-        )
-
-    def test_execute_empty_tables(
-        self,
-        mock_file_writer: Mock,
-        tmp_path: Path,
-    ) -> None:
-        """テーブルが0件の場合も正常に動作することを確認."""
-        mock_repo = Mock()
-        mock_repo.list_tables.return_value = []
-        mock_repo.get_table_reference_counts.return_value = []
-
-        usecase = ExportReferenceCountUseCase(
-            table_repository=mock_repo,
-            file_writer=mock_file_writer,
-        )
-
-        request = ExportReferenceCountRequest(
-            project_ids=["project-a"],
-            output_path=tmp_path / "output.csv",
-        )
-
-        result = usecase.execute(request)
-
-        assert result.tables_count == 0
+        mock_table_repository.list_tables.assert_called_once_with(_PROJECTS_AB)
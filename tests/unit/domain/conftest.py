@@ -0,0 +1,14 @@
+"""ドメイン層テスト共通のフィクスチャ."""
+
+import pytest
+
+from domain.value_objects.table_id import TableId
+
+
+@pytest.fixture(scope="session")
+def table_id() -> TableId:
+    """テスト用のTableId.
+
+    TableIdは不変でどのテストも変更しないため、セッション全体で共有する。
+    """
+    return TableId(project_id="project", dataset_id="dataset", table_id="table")
@@ -9,11 +9,6 @@ from domain.value_objects.table_id import TableId
 class TestLineageNode:
     """LineageNodeエンティティのテスト."""
 
-    @pytest.fixture
-    def table_id(self) -> TableId:
-        """テスト用のTableId."""
-        return TableId(project_id="project", dataset_id="dataset", table_id="table")
-
     @pytest.fixture
     def upstream_table_id(self) -> TableId:
         """上流テーブルのTableId."""
@@ -26,69 +21,53 @@ class TestLineageNode:
             project_id="project", dataset_id="dataset", table_id="downstream"
         )
 
-    def test_is_leaf_returns_true_when_no_downstream(self, table_id: TableId) -> None:
-        """下流テーブルがない場合にTrueを返す."""
-        node = LineageNode(
-            table_id=table_id,
-            upstream_tables=[],
-            downstream_tables=[],
-        )
-        assert node.is_leaf is True
-
-    def test_is_leaf_returns_false_when_has_downstream(
-        self, table_id: TableId, downstream_table_id: TableId
+    @pytest.mark.parametrize(
+        ("has_downstream", "expected"),
+        [(False, True), (True, False)],
+        ids=["no_downstream", "has_downstream"],
+    )
+    def test_is_leaf(
+        self,
+        table_id: TableId,
+        downstream_table_id: TableId,
+        has_downstream: bool,
+        expected: bool,
     ) -> None:
-        """下流テーブルがある場合にFalseを返す."""
+        """下流テーブルがない場合のみTrueを返す."""
         node = LineageNode(
             table_id=table_id,
             upstream_tables=[],
-            downstream_tables=[downstream_table_id],
-        )
-        assert node.is_leaf is False
-
-    def test_has_upstream_returns_true_when_has_upstream(
-        self, table_id: TableId, upstream_table_id: TableId
-    ) -> None:
-        """上流テーブルがある場合にTrueを返す."""
-        node = LineageNode(
-            table_id=table_id,
-            upstream_tables=[upstream_table_id],
-            downstream_tables=[],
+            downstream_tables=[downstream_table_id] if has_downstream else [],
         )
-        assert node.has_upstream() is True
+        assert node.is_leaf is expected
 
-    def test_has_upstream_returns_false_when_no_upstream(
-        self, table_id: TableId
+    @pytest.mark.parametrize(
+        "linked", [True, False], ids=["has_upstream", "no_upstream"]
+    )
+    def test_has_upstream(
+        self, table_id: TableId, upstream_table_id: TableId, linked: bool
     ) -> None:
-        """上流テーブルがない場合にFalseを返す."""
+        """上流テーブルの有無を返す."""
         node = LineageNode(
             table_id=table_id,
-            upstream_tables=[],
+            upstream_tables=[upstream_table_id] if linked else [],
             downstream_tables=[],
         )
-        assert node.has_upstream() is False
+        assert node.has_upstream() is linked
 
-    def test_has_downstream_returns_true_when_has_downstream(
-        self, table_id: TableId, downstream_table_id: TableId
+    @pytest.mark.parametrize(
+        "linked", [True, False], ids=["has_downstream", "no_downstream"]
+    )
+    def test_has_downstream(
+        self, table_id: TableId, downstream_table_id: TableId, linked: bool
     ) -> None:
-        """下流テーブルがある場合にTrueを返す."""
+        """下流テーブルの有無を返す."""
         node = LineageNode(
             table_id=table_id,
             upstream_tables=[],
-            downstream_tables=[downstream_table_id],
+            downstream_tables=[downstream_table_id] if linked else [],
         )
-        assert node.has_downstream() is True
-
-    def test_has_downstream_returns_false_when_no_downstream(
-        self, table_id: TableId
-    ) -> None:
-        """下流テーブルがない場合にFalseを返す."""
-        node = LineageNode(
-            table_id=table_id,
-            upstream_tables=[],
-            downstream_tables=[],
-        )
-        assert node.has_downstream() is False
+        assert node.has_downstream() is linked
 
     def test_is_leaf_is_computed_field(
         self, table_id: TableId, downstream_table_id: TableId
@@ -107,21 +86,14 @@ class TestLineageNode:
 class TestLeafTable:
     """LeafTableエンティティのテスト."""
 
-    @pytest.fixture
-    def table_id(self) -> TableId:
-        """テスト用のTableId."""
-        return TableId(project_id="project", dataset_id="dataset", table_id="leaf")
-
-    def test_has_dependencies_returns_true_when_has_upstream(
-        self, table_id: TableId
-    ) -> None:
-        """上流依存がある場合にTrueを返す."""
-        leaf = LeafTable(table_id=table_id, upstream_count=3)
-        assert leaf.has_dependencies() is True
-
-    def test_has_dependencies_returns_false_when_no_upstream(
-        self, table_id: TableId
+    @pytest.mark.parametrize(
+        ("upstream_count", "expected"),
+        [(3, True), (0, False)],
+        ids=["has_upstream", "no_upstream"],
+    )
+    def test_has_dependencies(
+        self, table_id: TableId, upstream_count: int, expected: bool
     ) -> None:
-        """上流依存がない場合にFalseを返す."""
-        leaf = LeafTable(table_id=table_id, upstream_count=0)
-        assert leaf.has_dependencies() is False
+        """上流依存がある場合のみTrueを返す."""
+        leaf = LeafTable(table_id=table_id, upstream_count=upstream_count)
+        assert leaf.has_dependencies() is expected
@@ -1,36 +1,55 @@
 """Tableエンティティのテスト."""
 
+from collections.abc import Callable
+
 import pytest
 
 from domain.entities.analyzed_table import AnalyzedTable
-from domain.entities.table import Table
+from domain.entities.table import Table, TableType
 from domain.value_objects.table_id import TableId
 from domain.value_objects.usage_info import UsageInfo
 
 
-class TestTable:
-    """Tableエンティティのテスト."""
+# テーブル種別と対応する判定メソッド
+_TYPE_PREDICATES: dict[TableType, Callable[[Table], bool]] = {
+    "BASE TABLE": Table.is_base_table,
+    "VIEW": Table.is_view,
+    "EXTERNAL": Table.is_external,
+    "CLONE": Table.is_clone,
+    "SNAPSHOT": Table.is_snapshot,
+    "MATERIALIZED VIEW": Table.is_materialized_view,
+}
 
-    @pytest.fixture
-    def table_id(self) -> TableId:
-        """テスト用のTableId."""
-        return TableId(project_id="project", dataset_id="dataset", table_id="table")
 
-    def test_is_base_table_returns_true_for_base_table(self, table_id: TableId) -> None:
-        """BASE TABLEの場合にTrueを返す."""
-        table = Table(table_id=table_id, table_type="BASE TABLE")
-        assert table.is_base_table() is True
+@pytest.fixture(scope="module")
+def table(table_id: TableId) -> Table:
+    """テスト用のBASE TABLE.
 
-    def test_is_base_table_returns_false_for_view(self, table_id: TableId) -> None:
-        """VIEWの場合にFalseを返す."""
-        table = Table(table_id=table_id, table_type="VIEW")
-        assert table.is_base_table() is False
+    読み取り専用のテストで共有し、テストごとのモデル構築を省く。
+    """
+    return Table(table_id=table_id, table_type="BASE TABLE")
 
-    def test_equality_based_on_table_id(self, table_id: TableId) -> None:
-        """同じtable_idを持つTableは等価とみなされる."""
+
+class TestTable:
+    """Tableエンティティのテスト."""
+
+    @pytest.mark.parametrize("table_type", list(_TYPE_PREDICATES))
+    def test_only_matching_type_predicate_is_true(
+        self, table_id: TableId, table_type: TableType
+    ) -> None:
+        """テーブル種別に対応する判定メソッドのみTrueを返す."""
+        table = Table(table_id=table_id, table_type=table_type)
+        assert {t: predicate(table) for t, predicate in _TYPE_PREDICATES.items()} == {
+            t: t == table_type for t in _TYPE_PREDICATES
+        }
+
+    def test_identity_based_on_table_id(self, table_id: TableId) -> None:
+        """同じtable_idを持つTableは等価・同一ハッシュとなり、setで1つにまとまる."""
         table1 = Table(table_id=table_id, table_type="BASE TABLE")
         table2 = Table(table_id=table_id, table_type="VIEW")
         assert table1 == table2
+        assert hash(table1) == hash(table2)
+        assert len({table1, table2}) == 1
 
     def test_inequality_with_different_table_id(self) -> None:
         """異なるtable_idを持つTableは等価ではない."""
@@ -44,22 +63,10 @@ class TestTable:
         )
         assert table1 != table2
 
-    def test_hash_based_on_table_id(self, table_id: TableId) -> None:
-        """同じtable_idを持つTableは同じハッシュ値を持つ."""
-        table1 = Table(table_id=table_id, table_type="BASE TABLE")
-        table2 = Table(table_id=table_id, table_type="VIEW")
-        assert hash(table1) == hash(table2)
-
-    def test_can_be_used_in_set(self, table_id: TableId) -> None:
-        """Tableをsetで使用できる."""
-        table1 = Table(table_id=table_id, table_type="BASE TABLE")
-        table2 = Table(table_id=table_id, table_type="VIEW")
-        table_set = {table1, table2}
-        assert len(table_set) == 1
-
-    def test_id_property_returns_table_id(self, table_id: TableId) -> None:
+    def test_id_property_returns_table_id(
+        self, table: Table, table_id: TableId
+    ) -> None:
         """idプロパティがtable_idを返す."""
-        table = Table(table_id=table_id, table_type="BASE TABLE")
         assert table.id == table_id
 
 
@@ -81,16 +88,6 @@ class TestUsageInfo:
 class TestAnalyzedTable:
     """AnalyzedTableエンティティのテスト."""
 
-    @pytest.fixture
-    def table_id(self) -> TableId:
-        """テスト用のTableId."""
-        return TableId(project_id="project", dataset_id="dataset", table_id="table")
-
-    @pytest.fixture
-    def table(self, table_id: TableId) -> Table:
-        """テスト用のTable."""
-        return Table(table_id=table_id, table_type="BASE TABLE")
-
     def test_id_returns_table_id(self, table: Table, table_id: TableId) -> None:
         """idプロパティがtable_idを返す."""
         analyzed = AnalyzedTable(table=table)
@@ -0,0 +1,32 @@
+"""TableId値オブジェクトのテスト."""
+
+import pytest
+
+from domain.value_objects.table_id import TableId
+
+
+class TestTableId:
+    """TableId値オブジェクトのテスト."""
+
+    def test_from_fqn_round_trip(self) -> None:
+        """from_fqnで生成したTableIdのfqnが元の文字列と一致する."""
+        table_id = TableId.from_fqn("project.dataset.table")
+        assert table_id == TableId(
+            project_id="project", dataset_id="dataset", table_id="table"
+        )
+        assert table_id.fqn == "project.dataset.table"
+
+    def test_from_fqn_raises_on_invalid_format(self) -> None:
+        """不正な形式のFQNでValueErrorを発生させる."""
+        with pytest.raises(ValueError, match="Invalid FQN format"):
+            TableId.from_fqn("project.dataset")
+
+    def test_fqn_follows_model_copy(self) -> None:
+        """model_copyで値を変更したTableIdのfqnが新しい値を反映する."""
+        original = TableId(project_id="project", dataset_id="dataset", table_id="table")
+        assert original.fqn == "project.dataset.table"
+
+        copied = original.model_copy(update={"table_id": "other"})
+
+        assert copied.fqn == "project.dataset.other"
+        assert str(copied) == "project.dataset.other"
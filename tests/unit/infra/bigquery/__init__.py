@@ -0,0 +1 @@
+"""BigQuery infraのテストパッケージ."""
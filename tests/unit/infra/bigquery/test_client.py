@@ -0,0 +1,78 @@
+"""BigQueryClientFactoryのユニットテスト."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from google.api_core.exceptions import Forbidden
+from google.cloud import bigquery
+
+from infra.bigquery.client import BigQueryClientFactory
+from infra.bigquery.exceptions import BigQueryConnectionError
+
+
+@pytest.fixture
+def created_clients(monkeypatch: pytest.MonkeyPatch) -> list[Mock]:
+    """bigquery.Clientを差し替え、生成されたモッククライアントを記録するフィクスチャ."""
+    clients: list[Mock] = []
+
+    def create(project: str | None) -> Mock:
+        client = Mock(project=project)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(bigquery, "Client", create)
+    return clients
+
+
+class TestBigQueryClientFactory:
+    """BigQueryClientFactoryのテストクラス."""
+
+    def test_reuses_client_across_calls(self, created_clients: list[Mock]) -> None:
+        """2回目以降のget_clientで同じクライアントが使い回されることを確認."""
+        factory = BigQueryClientFactory(project_id="project-a")
+
+        with factory.get_client() as first, factory.get_client() as second:
+            assert first is second
+
+        assert [c.project for c in created_clients] == ["project-a"]
+        created_clients[0].close.assert_not_called()
+
+    def test_close_releases_client(self, created_clients: list[Mock]) -> None:
+        """closeでクライアントが閉じられ、次回呼び出しで再生成されることを確認."""
+        factory = BigQueryClientFactory()
+
+        with factory.get_client():
+            pass
+        factory.close()
+        with factory.get_client():
+            pass
+
+        assert len(created_clients) == 2
+        created_clients[0].close.assert_called_once()
+        created_clients[1].close.assert_not_called()
+
+    def test_context_manager_closes_client(self, created_clients: list[Mock]) -> None:
+        """ファクトリのwithブロック終了時にクライアントが閉じられることを確認."""
+        with BigQueryClientFactory() as factory:
+            with factory.get_client():
+                pass
+            created_clients[0].close.assert_not_called()
+
+        created_clients[0].close.assert_called_once()
+
+    def test_close_without_client(self, created_clients: list[Mock]) -> None:
+        """クライアント未生成のままcloseしてもエラーにならないことを確認."""
+        BigQueryClientFactory().close()
+        assert created_clients == []
+
+    def test_wraps_creation_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """クライアント作成失敗がBigQueryConnectionErrorに変換されることを確認."""
+        monkeypatch.setattr(bigquery, "Client", Mock(side_effect=Forbidden("denied")))
+        factory = BigQueryClientFactory()
+
+        with (
+            pytest.raises(BigQueryConnectionError, match="Failed to create"),
+            factory.get_client(),
+        ):
+            pass
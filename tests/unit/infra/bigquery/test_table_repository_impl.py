@@ -0,0 +1,196 @@
+"""BigQueryTableRepositoryのユニットテスト."""
+
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from google.api_core.exceptions import BadRequest
+from google.cloud import bigquery
+from google.cloud.bigquery.table import Row
+
+from domain.entities.table import Table
+from domain.value_objects.table_id import TableId
+from domain.value_objects.usage_info import UsageInfo
+from infra.bigquery.client import BigQueryClientFactory
+from infra.bigquery.exceptions import TableRepositoryError
+from infra.bigquery.table_repository_impl import BigQueryTableRepository
+
+
+def _row(**values: Any) -> Row:
+    """BigQueryの結果行を生成するヘルパー."""
+    field_to_index = {name: i for i, name in enumerate(values)}
+    return Row(tuple(values.values()), field_to_index)
+
+
+@pytest.fixture
+def mock_client() -> Mock:
+    """モックBigQueryクライアントのフィクスチャ."""
+    return create_autospec(bigquery.Client, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def repo(mock_client: Mock) -> BigQueryTableRepository:
+    """リポジトリのフィクスチャ."""
+    mock_client_factory = create_autospec(
+        BigQueryClientFactory, instance=True, spec_set=True
+    )
+    mock_client_factory.get_client.return_value.__enter__.return_value = mock_client
+    return BigQueryTableRepository(mock_client_factory)
+
+
+class TestListTables:
+    """list_tablesメソッドのテストクラス."""
+
+    def test_empty_project_ids(
+        self, repo: BigQueryTableRepository, mock_client: Mock
+    ) -> None:
+        """空のプロジェクトIDリストでクエリを実行せず空リストが返ることを確認."""
+        assert repo.list_tables([]) == []
+        mock_client.query.assert_not_called()
+
+    def test_converts_rows_to_tables(
+        self, repo: BigQueryTableRepository, mock_client: Mock
+    ) -> None:
+        """クエリ結果の各行がTableに変換されることを確認."""
+        mock_client.query.return_value.result.return_value = [
+            _row(
+                project_id="project-a",
+                dataset_id="dataset1",
+                table_id="table1",
+                table_type="BASE TABLE",
+            ),
+            _row(
+                project_id="project-a",
+                dataset_id="dataset1",
+                table_id="view1",
+                table_type="VIEW",
+            ),
+        ]
+
+        result = repo.list_tables(["project-a"])
+
+        assert len(result) == 2
+        assert result[0].table_id == TableId(
+            project_id="project-a", dataset_id="dataset1", table_id="table1"
+        )
+        assert result[0].is_base_table() is True
+        assert result[1].is_view() is True
+
+    def test_wraps_api_error(
+        self, repo: BigQueryTableRepository, mock_client: Mock
+    ) -> None:
+        """APIエラーがTableRepositoryErrorに変換されることを確認."""
+        mock_client.query.side_effect = BadRequest("invalid query")
+
+        with pytest.raises(TableRepositoryError, match="Failed to list tables"):
+            repo.list_tables(["project-a"])
+
+
+class TestGetTableReferenceCounts:
+    """get_table_reference_countsメソッドのテストクラス."""
+
+    @pytest.fixture
+    def tables(self) -> list[Table]:
+        """テスト用のTableリスト."""
+        return [
+            Table(
+                table_id=TableId(
+                    project_id="project-a", dataset_id="dataset1", table_id="table1"
+                ),
+                table_type="BASE TABLE",
+            ),
+            Table(
+                table_id=TableId(
+                    project_id="project-a", dataset_id="dataset1", table_id="table2"
+                ),
+                table_type="BASE TABLE",
+            ),
+        ]
+
+    def test_empty_tables(
+        self, repo: BigQueryTableRepository, mock_client: Mock
+    ) -> None:
+        """空のテーブルリストでクエリを実行せず空リストが返ることを確認."""
+        assert repo.get_table_reference_counts([]) == []
+        mock_client.query.assert_not_called()
+
+    def test_joins_reference_counts_by_table_id(
+        self,
+        repo: BigQueryTableRepository,
+        mock_client: Mock,
+        tables: list[Table],
+    ) -> None:
+        """参照回数がテーブルIDで結合され、対象外テーブルの行は無視されることを確認."""
+        mock_client.query.return_value.result.return_value = [
+            _row(
+                project_id="project-a",
+                dataset_id="dataset1",
+                table_id="table1",
+                job_count=100,
+                unique_user=5,
+            ),
+            _row(
+                project_id="project-a",
+                dataset_id="dataset1",
+                table_id="other",
+                job_count=7,
+                unique_user=1,
+            ),
+        ]
+
+        result = repo.get_table_reference_counts(tables)
+
+        assert [t.table for t in result] == tables
+        assert result[0].usage_info is not None
+        assert result[0].usage_info.job_count == 100
+        assert result[0].usage_info.unique_user == 5
+        assert result[1].usage_info is not None
+        assert result[1].usage_info.job_count == 0
+        assert result[1].is_unused() is True
+
+    def test_unreferenced_tables_share_zero_usage(
+        self,
+        repo: BigQueryTableRepository,
+        mock_client: Mock,
+        tables: list[Table],
+    ) -> None:
+        """参照がないテーブルには共通の0件の利用状況が設定されることを確認."""
+        mock_client.query.return_value.result.return_value = []
+
+        result = repo.get_table_reference_counts(tables)
+
+        assert [t.usage_info for t in result] == [
+            UsageInfo(job_count=0, unique_user=0)
+        ] * len(tables)
+        assert result[0].usage_info is result[1].usage_info
+
+    def test_filters_query_by_table_projects(
+        self,
+        repo: BigQueryTableRepository,
+        mock_client: Mock,
+        tables: list[Table],
+    ) -> None:
+        """対象テーブルのプロジェクトと期間がクエリパラメータで渡されることを確認."""
+        mock_client.query.return_value.result.return_value = []
+
+        repo.get_table_reference_counts(tables)
+
+        job_config = mock_client.query.call_args.kwargs["job_config"]
+        params = {p.name: p for p in job_config.query_parameters}
+        assert params["days_back"].value == 90
+        assert params["project_ids"].values == ["project-a"]
+
+    def test_wraps_api_error(
+        self,
+        repo: BigQueryTableRepository,
+        mock_client: Mock,
+        tables: list[Table],
+    ) -> None:
+        """APIエラーがTableRepositoryErrorに変換されることを確認."""
+        mock_client.query.side_effect = BadRequest("invalid query")
+
+        with pytest.raises(
+            TableRepositoryError, match="Failed to get table reference counts"
+        ):
+            repo.get_table_reference_counts(tables)
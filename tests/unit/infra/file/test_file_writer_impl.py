@@ -1,6 +1,8 @@
 """PandasFileWriterのユニットテスト."""
 
+import csv
 import json
+
 from pathlib import Path
 
 import pytest
@@ -13,15 +15,31 @@ from infra.file.exceptions import FileWriterError
 from infra.file.file_writer_impl import PandasFileWriter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def file_writer() -> PandasFileWriter:
-    """PandasFileWriterのフィクスチャ."""
+    """PandasFileWriterのフィクスチャ.
+
+    状態を持たないため、モジュール内の全テストで共有する。
+    """
     return PandasFileWriter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """出力先ディレクトリのフィクスチャ.
+
+    各テストは異なるファイル名に書き込むため、テストごとにディレクトリを作成せず
+    モジュール単位で共有する。
+    """
+    return tmp_path_factory.mktemp("file_writer")
+
+
+@pytest.fixture(scope="module")
 def sample_analyzed_tables() -> list[AnalyzedTable]:
-    """テスト用のAnalyzedTableリスト."""
+    """テスト用のAnalyzedTableリスト.
+
+    どのテストもリストや要素を変更せず読み取るだけのため、モジュール内で共有する。
+    """
     table1 = Table(
         table_id=TableId(
             project_id="project-a",
@@ -57,10 +75,10 @@ class TestPandasFileWriter:
         self,
         file_writer: PandasFileWriter,
         sample_analyzed_tables: list[AnalyzedTable],
-        tmp_path: Path,
+        out_dir: Path,
     ) -> None:
         """CSV形式で出力できることを確認."""
-        output_path = tmp_path / "output.csv"
+        output_path = out_dir / "output.csv"
 
         file_writer.write_analyzed_tables(
             sample_analyzed_tables,
@@ -69,21 +87,21 @@ class TestPandasFileWriter:
         )
 
         assert output_path.exists()
-        content = output_path.read_text()
-        lines = content.strip().split("\n")
+        with output_path.open(encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
 
-        assert len(lines) == 3  # ヘッダー + 2行
-        assert "project_id" in lines[0]
-        assert "project-a" in lines[1]
+        assert len(rows) == 2
+        assert rows[0]["project_id"] == "project-a"
+        assert rows[0]["job_count"] == "100"
 
     def test_write_analyzed_tables_json(
         self,
         file_writer: PandasFileWriter,
         sample_analyzed_tables: list[AnalyzedTable],
-        tmp_path: Path,
+        out_dir: Path,
     ) -> None:
         """JSON形式で出力できることを確認."""
-        output_path = tmp_path / "output.json"
+        output_path = out_dir / "output.json"
 
         file_writer.write_analyzed_tables(
             sample_analyzed_tables,
@@ -98,14 +116,33 @@ class TestPandasFileWriter:
         assert data[0]["project_id"] == "project-a"
         assert data[0]["job_count"] == 100
 
+    def test_write_analyzed_tables_without_usage_info(
+        self,
+        file_writer: PandasFileWriter,
+        sample_analyzed_tables: list[AnalyzedTable],
+        out_dir: Path,
+    ) -> None:
+        """利用状況が未取得の行があっても件数が整数のまま出力されることを確認."""
+        output_path = out_dir / "partial_usage.csv"
+        tables = [
+            sample_analyzed_tables[0],
+            AnalyzedTable(table=sample_analyzed_tables[1].table, usage_info=None),
+        ]
+
+        file_writer.write_analyzed_tables(tables, output_path, output_format="csv")
+
+        lines = output_path.read_text().splitlines()
+        assert lines[1].endswith(",100,5")
+        assert lines[2].endswith(",,")
+
     def test_write_analyzed_tables_creates_parent_directory(
         self,
         file_writer: PandasFileWriter,
         sample_analyzed_tables: list[AnalyzedTable],
-        tmp_path: Path,
+        out_dir: Path,
     ) -> None:
         """親ディレクトリが存在しない場合に作成されることを確認."""
-        output_path = tmp_path / "nested" / "dir" / "output.csv"
+        output_path = out_dir / "nested" / "dir" / "output.csv"
 
         file_writer.write_analyzed_tables(
             sample_analyzed_tables,
@@ -118,10 +155,10 @@ class TestPandasFileWriter:
     def test_write_analyzed_tables_empty_list(
         self,
         file_writer: PandasFileWriter,
-        tmp_path: Path,
+        out_dir: Path,
     ) -> None:
-        """空のリストでもファイルが作成されることを確認."""
-        output_path = tmp_path / "empty.csv"
+        """空のリストでもヘッダー行のみのファイルが作成されることを確認."""
+        output_path = out_dir / "empty.csv"
 
         file_writer.write_analyzed_tables(
             [],
@@ -129,16 +166,18 @@ class TestPandasFileWriter:
             output_format="csv",
         )
 
-        assert output_path.exists()
+        assert output_path.read_text().splitlines() == [
+            "project_id,dataset_id,table_id,table_type,job_count,unique_user"
+        ]
 
     def test_write_analyzed_tables_unsupported_format(
         self,
         file_writer: PandasFileWriter,
         sample_analyzed_tables: list[AnalyzedTable],
-        tmp_path: Path,
+        out_dir: Path,
     ) -> None:
         """サポートされていない形式の場合にエラーが発生することを確認."""
-        output_path = tmp_path / "output.xml"
+        output_path = out_dir / "output.xml"
 
         with pytest.raises(FileWriterError) as exc_info:
             file_writer.write_analyzed_tables(
@@ -147,4 +186,4 @@ class TestPandasFileWriter:
                 output_format="xml",  # type: ignore[arg-type]
             )
 
-        assert "Unsupported format" in str(exc_info.value)
+        assert exc_info.value.args[0] == "Unsupported format: xml"
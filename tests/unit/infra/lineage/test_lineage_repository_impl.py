@@ -1,47 +1,186 @@
 """DataCatalogLineageRepositoryのユニットテスト."""
 
+from collections.abc import Callable
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, sentinel
 
 import pytest
 
+from google.cloud.datacatalog_lineage_v1 import EntityReference, LineageClient, Link
+
 from domain.value_objects.table_id import TableId
+from infra.lineage.client import LineageClientFactory
+from infra.lineage.exceptions import LineageApiError, LineageRepositoryError
 from infra.lineage.lineage_repository_impl import DataCatalogLineageRepository
 
 
+# 複数のテストで使い回すテーブルID（TableIdは不変のため共有できる）
+_ROOT = TableId(project_id="project-a", dataset_id="raw", table_id="events")
+_TARGET = TableId(project_id="project-a", dataset_id="staging", table_id="events")
+_LEAF = TableId(project_id="project-a", dataset_id="reports", table_id="final")
+_MIDDLE_B = TableId(project_id="project-b", dataset_id="staging", table_id="events")
+_LEAF_B = TableId(project_id="project-b", dataset_id="reports", table_id="final")
+_LEAF_C = TableId(project_id="project-c", dataset_id="reports", table_id="final")
+
+_SearchStub = Callable[[Any, Any, str], list[TableId]] | Exception
+
+
+def _links(
+    links: dict[TableId, list[TableId]],
+) -> Callable[[Any, Any, str], list[TableId]]:
+    """テーブル間のリンクをFQNの完全一致で引くside_effectを生成するヘルパー."""
+    by_fqn = {f"bigquery:{table_id.fqn}": linked for table_id, linked in links.items()}
+
+    def search(client: Any, project_id: Any, fqn: str) -> list[TableId]:
+        return by_fqn.get(fqn, [])
+
+    return search
+
+
+def _stub_searches(
+    monkeypatch: pytest.MonkeyPatch,
+    repo: DataCatalogLineageRepository,
+    *,
+    downstream: _SearchStub | None = None,
+    upstream: _SearchStub | None = None,
+) -> tuple[Mock, Mock]:
+    """リポジトリの下流・上流検索メソッドをスタブに差し替えるヘルパー.
+
+    monkeypatchで差し替えるため、テスト終了時に自動で元に戻る。
+    未指定の検索は常に空リストを返す。
+
+    Returns:
+        (下流検索のモック, 上流検索のモック)
+    """
+    mock_downstream = Mock(side_effect=downstream or _links({}))
+    mock_upstream = Mock(side_effect=upstream or _links({}))
+    monkeypatch.setattr(repo, "_search_downstream_tables", mock_downstream)
+    monkeypatch.setattr(repo, "_search_upstream_tables", mock_upstream)
+    return mock_downstream, mock_upstream
+
+
+@pytest.fixture(scope="module")
+def mock_client_factory() -> Mock:
+    """モックClientFactoryのフィクスチャ.
+
+    呼び出し履歴を検証するテストはないため、モジュール内の全テストで共有する。
+    """
+    attrs: dict[str, Any] = {
+        "location": "us",
+        "get_client.return_value.__enter__.return_value": sentinel.client,
+    }
+    return create_autospec(LineageClientFactory, instance=True, spec_set=True, **attrs)
+
+
+class TestGetTableLineage:
+    """get_table_lineageメソッドのテストクラス."""
+
+    def test_returns_upstream_and_downstream(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """上流・下流の検索結果がLineageNodeにまとめられることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+
+        target = _TARGET
+        upstream = _ROOT
+        downstream = _LEAF
+
+        mock_downstream, mock_upstream = _stub_searches(
+            monkeypatch,
+            repo,
+            downstream=_links({target: [downstream]}),
+            upstream=_links({target: [upstream]}),
+        )
+        result = repo.get_table_lineage(target)
+
+        assert result.table_id == target
+        assert result.upstream_tables == [upstream]
+        assert result.downstream_tables == [downstream]
+        assert result.is_leaf is False
+        mock_upstream.assert_called_once()
+        mock_downstream.assert_called_once()
+
+    def test_wraps_api_error(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """片方の検索が失敗した場合にLineageRepositoryErrorに変換されることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+
+        target = _TARGET
+
+        _stub_searches(monkeypatch, repo, downstream=LineageApiError("API error"))
+        with pytest.raises(LineageRepositoryError, match="リネージ情報取得に失敗"):
+            repo.get_table_lineage(target)
+
+
+class TestGetLeafTables:
+    """get_leaf_tablesメソッドのテストクラス."""
+
+    def test_empty_table_ids(self, mock_client_factory: Mock) -> None:
+        """空のテーブルIDリストで空リストが返ることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+        assert repo.get_leaf_tables([]) == []
+
+    def test_returns_leaves_in_input_order(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """下流を持たないテーブルのみが入力順で返ることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+        tables = [_ROOT, _LEAF, _TARGET, _LEAF_B]
+
+        # _ROOT -> _TARGET -> _LEAF, _LEAF_B は孤立
+        _stub_searches(
+            monkeypatch,
+            repo,
+            downstream=_links({_ROOT: [_TARGET], _TARGET: [_LEAF]}),
+            upstream=_links({_TARGET: [_ROOT], _LEAF: [_TARGET]}),
+        )
+        result = repo.get_leaf_tables(tables)
+
+        assert [r.table_id for r in result] == [_LEAF, _LEAF_B]
+        assert [r.upstream_count for r in result] == [1, 0]
+
+    def test_ignores_downstream_outside_allowed_projects(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """許可外プロジェクトの下流のみを持つテーブルがリーフとして扱われることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+
+        _stub_searches(monkeypatch, repo, downstream=_links({_ROOT: [_MIDDLE_B]}))
+        result = repo.get_leaf_tables([_ROOT], allowed_project_ids=["project-a"])
+
+        assert [r.table_id for r in result] == [_ROOT]
+
+    def test_wraps_api_error(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """検索が失敗した場合にLineageRepositoryErrorに変換されることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+
+        _stub_searches(monkeypatch, repo, downstream=LineageApiError("API error"))
+        with pytest.raises(LineageRepositoryError, match="リーフノード判定に失敗"):
+            repo.get_leaf_tables([_ROOT, _LEAF])
+
+
 class TestFindLeafTablesFromRoots:
     """find_leaf_tables_from_rootsメソッドのテストクラス."""
 
-    @pytest.fixture
-    def mock_client_factory(self) -> Mock:
-        """モックClientFactoryのフィクスチャ."""
-        mock = Mock()
-        mock.location = "us"
-        mock.get_client.return_value.__enter__ = Mock(return_value=Mock())
-        mock.get_client.return_value.__exit__ = Mock(return_value=None)
-        return mock
-
     def test_empty_root_tables(self, mock_client_factory: Mock) -> None:
         """空のルートテーブルリストで空リストが返ることを確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
         result = repo.find_leaf_tables_from_roots([])
         assert result == []
 
-    def test_single_root_is_leaf(self, mock_client_factory: Mock) -> None:
+    def test_single_root_is_leaf(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """ルート自体がリーフの場合を確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
+        root = _ROOT
 
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", return_value=[]
-            ) as mock_downstream,
-            patch.object(
-                repo, "_search_upstream_tables", return_value=[]
-            ) as mock_upstream,
-        ):
-            result = repo.find_leaf_tables_from_roots([root])
+        mock_downstream, mock_upstream = _stub_searches(monkeypatch, repo)
+        result = repo.find_leaf_tables_from_roots([root])
 
         assert len(result) == 1
         assert result[0].table_id == root
@@ -49,41 +188,35 @@ class TestFindLeafTablesFromRoots:
         mock_downstream.assert_called_once()
         mock_upstream.assert_called_once()
 
-    def test_single_root_with_downstream_leaf(self, mock_client_factory: Mock) -> None:
+    def test_single_root_with_downstream_leaf(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """単一ルートから下流リーフを見つける場合を確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
-        leaf = TableId(project_id="project-a", dataset_id="reports", table_id="final")
+        root = _ROOT
+        leaf = _LEAF
 
         # rootの下流はleaf、leafの下流は空
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "events" in fqn:
-                return [leaf]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "final" in fqn:
-                return [root]
-            return []
-
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            result = repo.find_leaf_tables_from_roots([root])
+        _stub_searches(
+            monkeypatch,
+            repo,
+            downstream=_links({root: [leaf]}),
+            upstream=_links({leaf: [root]}),
+        )
+        result = repo.find_leaf_tables_from_roots([root])
 
         assert len(result) == 1
         assert result[0].table_id == leaf
         assert result[0].upstream_count == 1
 
-    def test_multiple_leaves(self, mock_client_factory: Mock) -> None:
+    def test_multiple_leaves(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """複数のリーフが見つかる場合を確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
+        root = _ROOT
         leaf1 = TableId(
             project_id="project-a", dataset_id="reports", table_id="report1"
         )
@@ -92,28 +225,43 @@ class TestFindLeafTablesFromRoots:
         )
 
         # rootから2つのリーフへ分岐
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "events" in fqn:
-                return [leaf1, leaf2]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            return [root]
-
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            result = repo.find_leaf_tables_from_roots([root])
+        _stub_searches(
+            monkeypatch,
+            repo,
+            downstream=_links({root: [leaf1, leaf2]}),
+            upstream=_links({leaf1: [root], leaf2: [root]}),
+        )
+        result = repo.find_leaf_tables_from_roots([root])
 
         assert len(result) == 2
         table_ids = [r.table_id for r in result]
         assert leaf1 in table_ids
         assert leaf2 in table_ids
 
-    def test_cycle_detection(self, mock_client_factory: Mock) -> None:
+    def test_shared_downstream_searched_once(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """複数の経路から到達する下流テーブルが1度だけ探索されることを確認."""
+        repo = DataCatalogLineageRepository(mock_client_factory)
+
+        # ROOT -> TARGET -> LEAF, ROOT -> MIDDLE_B -> LEAF (菱形)
+        mock_downstream, mock_upstream = _stub_searches(
+            monkeypatch,
+            repo,
+            downstream=_links(
+                {_ROOT: [_TARGET, _MIDDLE_B], _TARGET: [_LEAF], _MIDDLE_B: [_LEAF]}
+            ),
+            upstream=_links({_LEAF: [_TARGET, _MIDDLE_B]}),
+        )
+        result = repo.find_leaf_tables_from_roots([_ROOT])
+
+        assert [(r.table_id, r.upstream_count) for r in result] == [(_LEAF, 2)]
+        assert mock_downstream.call_count == 4
+        mock_upstream.assert_called_once()
+
+    def test_cycle_detection(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """循環参照がある場合に無限ループしないことを確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
@@ -122,37 +270,31 @@ class TestFindLeafTablesFromRoots:
         table_c = TableId(project_id="project-a", dataset_id="raw", table_id="table_c")
 
         # A -> B -> C -> A (循環)
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "table_a" in fqn:
-                return [table_b]
-            elif "table_b" in fqn:
-                return [table_c]
-            elif "table_c" in fqn:
-                return [table_a]  # 循環
-            return []
-
+        downstream = _links(
+            {table_a: [table_b], table_b: [table_c], table_c: [table_a]}
+        )
         call_count = 0
 
         def counting_downstream(
-            client: Any, project_id: Any, fqn: Any
+            client: Any, project_id: Any, fqn: str
         ) -> list[TableId]:
             nonlocal call_count
             call_count += 1
             if call_count > 10:
                 pytest.fail("無限ループが検出されました")
-            return mock_downstream(client, project_id, fqn)
+            return downstream(client, project_id, fqn)
 
-        with patch.object(
-            repo, "_search_downstream_tables", side_effect=counting_downstream
-        ):
-            result = repo.find_leaf_tables_from_roots([table_a])
+        _stub_searches(monkeypatch, repo, downstream=counting_downstream)
+        result = repo.find_leaf_tables_from_roots([table_a])
 
         # 循環のためリーフは見つからない
         assert len(result) == 0
         # 各テーブルは1回ずつのみ訪問される
         assert call_count == 3
 
-    def test_deep_hierarchy(self, mock_client_factory: Mock) -> None:
+    def test_deep_hierarchy(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """深い階層のリネージを正しく探索できることを確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
@@ -162,220 +304,177 @@ class TestFindLeafTablesFromRoots:
         ]
 
         # table_0 -> table_1 -> table_2 -> table_3 -> table_4 (leaf)
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            for i in range(4):
-                if f"table_{i}" in fqn:
-                    return [tables[i + 1]]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            for i in range(1, 5):
-                if f"table_{i}" in fqn:
-                    return [tables[i - 1]]
-            return []
-
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            result = repo.find_leaf_tables_from_roots([tables[0]])
+        downstream = _links({tables[i]: [tables[i + 1]] for i in range(4)})
+        upstream = _links({tables[i]: [tables[i - 1]] for i in range(1, 5)})
+
+        _stub_searches(monkeypatch, repo, downstream=downstream, upstream=upstream)
+        result = repo.find_leaf_tables_from_roots([tables[0]])
 
         assert len(result) == 1
         assert result[0].table_id == tables[4]
         assert result[0].upstream_count == 1
 
-    def test_cross_project_lineage(self, mock_client_factory: Mock) -> None:
+    def test_cross_project_lineage(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """プロジェクトを跨いだリネージを正しく探索できることを確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
-        middle = TableId(
-            project_id="project-b", dataset_id="staging", table_id="events"
-        )
-        leaf = TableId(project_id="project-c", dataset_id="reports", table_id="final")
+        root = _ROOT
+        middle = _MIDDLE_B
+        leaf = _LEAF_C
 
         # project-a -> project-b -> project-c
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-a" in fqn:
-                return [middle]
-            elif "project-b" in fqn:
-                return [leaf]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-c" in fqn:
-                return [middle]
-            elif "project-b" in fqn:
-                return [root]
-            return []
-
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            result = repo.find_leaf_tables_from_roots([root])
+        downstream = _links({root: [middle], middle: [leaf]})
+        upstream = _links({leaf: [middle], middle: [root]})
+
+        _stub_searches(monkeypatch, repo, downstream=downstream, upstream=upstream)
+        result = repo.find_leaf_tables_from_roots([root])
 
         assert len(result) == 1
         assert result[0].table_id == leaf
         assert result[0].table_id.project_id == "project-c"
 
     def test_project_filtering_skips_outside_projects(
-        self, mock_client_factory: Mock
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """許可されたプロジェクト外のテーブルをスキップすることを確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
-        middle = TableId(
-            project_id="project-b", dataset_id="staging", table_id="events"
-        )
-        leaf = TableId(project_id="project-c", dataset_id="reports", table_id="final")
+        root = _ROOT
+        middle = _MIDDLE_B
+        leaf = _LEAF_C
 
         # project-a -> project-b -> project-c
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-a" in fqn:
-                return [middle]
-            elif "project-b" in fqn:
-                return [leaf]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            return []
-
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            # project-a のみ許可 → project-b に到達した時点で探索終了
-            # project-a がリーフとして扱われる
-            result = repo.find_leaf_tables_from_roots(
-                [root], allowed_project_ids=["project-a"]
-            )
+        downstream = _links({root: [middle], middle: [leaf]})
+
+        _stub_searches(monkeypatch, repo, downstream=downstream)
+        # project-a のみ許可 → project-b に到達した時点で探索終了
+        # project-a がリーフとして扱われる
+        result = repo.find_leaf_tables_from_roots(
+            [root], allowed_project_ids=["project-a"]
+        )
 
         assert len(result) == 1
         assert result[0].table_id == root
         assert result[0].table_id.project_id == "project-a"
 
     def test_project_filtering_allows_multiple_projects(
-        self, mock_client_factory: Mock
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """複数プロジェクトを許可した場合の探索を確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
-        middle = TableId(
-            project_id="project-b", dataset_id="staging", table_id="events"
-        )
-        leaf = TableId(project_id="project-c", dataset_id="reports", table_id="final")
+        root = _ROOT
+        middle = _MIDDLE_B
+        leaf = _LEAF_C
 
         # project-a -> project-b -> project-c
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-a" in fqn:
-                return [middle]
-            elif "project-b" in fqn:
-                return [leaf]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-b" in fqn:
-                return [root]
-            return []
-
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            # project-a と project-b を許可 → project-c に到達した時点で探索終了
-            # project-b がリーフとして扱われる
-            result = repo.find_leaf_tables_from_roots(
-                [root], allowed_project_ids=["project-a", "project-b"]
-            )
+        downstream = _links({root: [middle], middle: [leaf]})
+        upstream = _links({middle: [root]})
+
+        _stub_searches(monkeypatch, repo, downstream=downstream, upstream=upstream)
+        # project-a と project-b を許可 → project-c に到達した時点で探索終了
+        # project-b がリーフとして扱われる
+        result = repo.find_leaf_tables_from_roots(
+            [root], allowed_project_ids=["project-a", "project-b"]
+        )
 
         assert len(result) == 1
         assert result[0].table_id == middle
         assert result[0].table_id.project_id == "project-b"
 
-    def test_project_filtering_none_allows_all(self, mock_client_factory: Mock) -> None:
+    def test_project_filtering_none_allows_all(
+        self, mock_client_factory: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """allowed_project_ids=None の場合は全プロジェクトを探索することを確認."""
         repo = DataCatalogLineageRepository(mock_client_factory)
 
-        root = TableId(project_id="project-a", dataset_id="raw", table_id="events")
-        leaf = TableId(project_id="project-b", dataset_id="reports", table_id="final")
-
-        def mock_downstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-a" in fqn:
-                return [leaf]
-            return []
-
-        def mock_upstream(client: Any, project_id: Any, fqn: Any) -> list[TableId]:
-            if "project-b" in fqn:
-                return [root]
-            return []
+        root = _ROOT
+        leaf = _LEAF_B
 
-        with (
-            patch.object(
-                repo, "_search_downstream_tables", side_effect=mock_downstream
-            ),
-            patch.object(repo, "_search_upstream_tables", side_effect=mock_upstream),
-        ):
-            # allowed_project_ids=None なので全プロジェクトを探索
-            result = repo.find_leaf_tables_from_roots([root], allowed_project_ids=None)
+        _stub_searches(
+            monkeypatch,
+            repo,
+            downstream=_links({root: [leaf]}),
+            upstream=_links({leaf: [root]}),
+        )
+        # allowed_project_ids=None なので全プロジェクトを探索
+        result = repo.find_leaf_tables_from_roots([root], allowed_project_ids=None)
 
         assert len(result) == 1
         assert result[0].table_id == leaf
         assert result[0].table_id.project_id == "project-b"
 
 
-class TestParseBigqueryFqn:
-    """_parse_bigquery_fqnメソッドのテストクラス."""
+class TestSearchDownstreamTables:
+    """_search_downstream_tablesメソッドのテストクラス."""
 
     @pytest.fixture
-    def mock_client_factory(self) -> Mock:
-        """モックClientFactoryのフィクスチャ."""
-        mock = Mock()
-        mock.location = "us"
-        return mock
+    def repo(self, mock_client_factory: Mock) -> DataCatalogLineageRepository:
+        """リポジトリのフィクスチャ."""
+        return DataCatalogLineageRepository(mock_client_factory)
+
+    def test_requests_max_page_size(self, repo: DataCatalogLineageRepository) -> None:
+        """上限のページサイズで検索し、BigQuery以外のリンクは除外されることを確認."""
+        client = create_autospec(LineageClient, instance=True, spec_set=True)
+        client.search_links.return_value = [
+            Link(target=EntityReference(fully_qualified_name=f"bigquery:{_LEAF.fqn}")),
+            Link(target=EntityReference(fully_qualified_name="spanner:p.i.d")),
+        ]
+
+        result = repo._search_downstream_tables(
+            client, "project-a", f"bigquery:{_ROOT.fqn}"
+        )
+
+        assert result == [_LEAF]
+        request = client.search_links.call_args.kwargs["request"]
+        assert request.parent == "projects/project-a/locations/us"
+        assert request.page_size == 100
+
+
+class TestParseBigqueryFqn:
+    """_parse_bigquery_fqnメソッドのテストクラス."""
 
     @pytest.fixture
     def repo(self, mock_client_factory: Mock) -> DataCatalogLineageRepository:
         """リポジトリのフィクスチャ."""
         return DataCatalogLineageRepository(mock_client_factory)
 
-    def test_normal_fqn(self, repo: DataCatalogLineageRepository) -> None:
-        """通常のFQN形式をパースできることを確認."""
-        result = repo._parse_bigquery_fqn("bigquery:project-a.dataset.table")
-        assert result is not None
-        assert result.project_id == "project-a"
-        assert result.dataset_id == "dataset"
-        assert result.table_id == "table"
-
-    def test_sharded_fqn(self, repo: DataCatalogLineageRepository) -> None:
-        """シャーディング形式のFQNをパースできることを確認."""
-        result = repo._parse_bigquery_fqn("bigquery:sharded:project-a.dataset.table")
-        assert result is not None
-        assert result.project_id == "project-a"
-        assert result.dataset_id == "dataset"
-        assert result.table_id == "table"
-
-    def test_non_bigquery_fqn(self, repo: DataCatalogLineageRepository) -> None:
-        """BigQuery以外のFQNでNoneが返ることを確認."""
-        result = repo._parse_bigquery_fqn("spanner:project.instance.database")
-        assert result is None
-
-    def test_invalid_parts_count(self, repo: DataCatalogLineageRepository) -> None:
-        """パーツ数が不正な場合Noneが返ることを確認."""
-        result = repo._parse_bigquery_fqn("bigquery:project.dataset")
-        assert result is None
-
-    def test_empty_string(self, repo: DataCatalogLineageRepository) -> None:
-        """空文字列でNoneが返ることを確認."""
-        result = repo._parse_bigquery_fqn("")
-        assert result is None
+    @pytest.mark.parametrize(
+        "fqn",
+        [
+            "bigquery:project-a.dataset.table",
+            "bigquery:sharded:project-a.dataset.table",
+        ],
+        ids=["normal", "sharded"],
+    )
+    def test_valid_fqn(self, repo: DataCatalogLineageRepository, fqn: str) -> None:
+        """通常形式・シャーディング形式のFQNをパースできることを確認."""
+        assert repo._parse_bigquery_fqn(fqn) == TableId(
+            project_id="project-a", dataset_id="dataset", table_id="table"
+        )
+
+    @pytest.mark.parametrize(
+        "fqn",
+        [
+            "spanner:project.instance.database",
+            "bigquery:project.dataset",
+            "",
+        ],
+        ids=["non_bigquery", "invalid_parts_count", "empty_string"],
+    )
+    def test_invalid_fqn(self, repo: DataCatalogLineageRepository, fqn: str) -> None:
+        """BigQuery以外・パーツ数不正・空文字列のFQNでNoneが返ることを確認."""
+        assert repo._parse_bigquery_fqn(fqn) is None
+
+    def test_interns_project_and_dataset_ids(
+        self, repo: DataCatalogLineageRepository
+    ) -> None:
+        """同じプロジェクト・データセットIDが同一オブジェクトとして共有されることを確認."""
+        first = repo._parse_bigquery_fqn("bigquery:project-a.dataset.table1")
+        second = repo._parse_bigquery_fqn("bigquery:project-a.dataset.table2")
+        assert first is not None
+        assert second is not None
+        assert first.project_id is second.project_id
+        assert first.dataset_id is second.dataset_id